@@ -3,6 +3,7 @@ This file must be run to cache the models locally before running the main script
 '''
 import os
 import logging
+from functools import lru_cache
 from transformers import AutoModelForSeq2SeqLM
 
 # Set logging level to INFO
@@ -14,7 +15,11 @@ MODEL_NAME_1 = "google/pegasus-cnn_dailymail"
 # for keyword extraction
 MODEL_NAME_2 = "Voicelab/vlt5-base-keywords"
 
+# The Hugging Face hub cache root, computed once at import time
+_HF_HUB = os.path.join(os.path.expanduser("~"), ".cache", "huggingface", "hub")
 
+
+@lru_cache(maxsize=None)
 def is_model_cached(model_name: str) -> bool:
     """Checks if the specified model is cached locally.
 
@@ -34,10 +39,10 @@ def is_model_cached(model_name: str) -> bool:
     True
     """
     # Construct the expected cache directory path
-    cache_dir = os.path.join(os.path.expanduser(
-        "~"), ".cache", "huggingface", "hub", "models--"+model_name.replace("/", "--"))
+    cache_dir = os.path.join(
+        _HF_HUB, "models--" + model_name.replace("/", "--"))
     # Check if the directory exists
-    return os.path.exists(cache_dir)
+    return os.path.isdir(cache_dir)
 
 
 # Pre-cache the models if it's not already cached
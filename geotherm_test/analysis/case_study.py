@@ -24,11 +24,19 @@ class CaseStudy:
     url : str
         URL of the case study.
     scorer : DecarbonizationScorer
-        Scorer object to assess relevance.
-    target_keywords_json : Path | str
-        Path to target keywords JSON file.
+        Scorer instance to assess relevance. A single instance can be
+        shared across case studies to avoid re-loading the keywords JSON
+        per case.
     generate_keywords : bool, optional
         Whether to generate keywords. Defaults to False.
+    defer_inference : bool, optional
+        Whether to defer keyword extraction, scoring, and summarization so
+        the owning pipeline can run them in batches across case studies.
+        Defaults to False.
+    pre_fetched_html : str or element.Tag, optional
+        Raw HTML (or an already-parsed body element) of the case study
+        page, fetched ahead of time by a concurrent fetcher. If None, the
+        page is fetched from the URL.
     verbose : bool, optional
         Whether to print verbose output. Defaults to False.
 
@@ -41,9 +49,7 @@ class CaseStudy:
     generate_keywords : bool
         Whether to generate keywords.
     scorer : DecarbonizationScorer
-        Scorer object to assess relevance.
-    target_keywords_json : Path | str
-        Path to target keywords JSON file.
+        Scorer instance to assess relevance.
     verbose : bool
         Whether to print verbose output.
     _html_content : str
@@ -61,14 +67,15 @@ class CaseStudy:
     """
 
     def __init__(self, title: str, url: str, scorer: DecarbonizationScorer,
-                 target_keywords_json: Path | str, generate_keywords: bool = False,
-                 verbose: bool = False):
+                 generate_keywords: bool = False, defer_inference: bool = False,
+                 pre_fetched_html: str = None, verbose: bool = False):
 
         self.title = title
         self.url = url
         self.generate_keywords = generate_keywords
-        self.scorer = scorer(target_keywords_json)
-        self.target_keywords_json = target_keywords_json
+        self.defer_inference = defer_inference
+        self._pre_fetched_html = pre_fetched_html
+        self.scorer = scorer
         self.verbose = verbose
 
         self._html_content = ""
@@ -88,12 +95,28 @@ class CaseStudy:
         determines relevance, and summarizes (if relevant).
         """
 
+        # Cheap title pre-screen: a title with no keyword hits cannot make
+        # the case relevant, so skip the fetch, parse, and model inference
+        # (only when no AI keywords are requested, since those need the text)
+        if not self.generate_keywords and self.scorer(self.title)[0] == 0:
+            self.relevance_score = 0
+            self.relevant_to_decarbonization = "Unrelated"
+            if self.verbose:
+                self._print_analysis_details()
+            return
+
         # Fetch html content
         self._get_html_content()
 
         # Extract text from html content
         self._get_text()
 
+        if self.defer_inference:
+            # Keyword extraction, scoring, and summarization are run in
+            # batches by the owning pipeline (see IsptHeatScraper), which
+            # calls `complete_analysis` once the batched results are in.
+            return
+
         if self.generate_keywords:
             # Extract keywords from text using VLT5 model
             self._extract_keywords()
@@ -108,44 +131,88 @@ class CaseStudy:
             # Summarize the text if relevant using Google Pegasus model
             self._summarize()
 
+    def complete_analysis(self, keywords: list = None,
+                          scores: tuple[int, int] = None):
+        """
+        Completes a deferred analysis once batched inference has run.
+
+        Parameters
+        ----------
+        keywords : list, optional
+            Keywords produced by a batched extraction run. If None, the
+            keywords are left as they are.
+        scores : tuple[int, int], optional
+            Relevance scores precomputed by the owning pipeline (e.g. on a
+            process pool). If None, the scorer is called here.
+        """
+        if keywords is not None:
+            self.keywords = keywords
+
+        # Determine relevance score and categorize the case study
+        self._determine_relevance(scores=scores)
+
+        if self.verbose:
+            self._print_analysis_details()
+
     def _get_html_content(self):
-        """Fetches the HTML content from the given URL."""
-        self._html_content = get_page_body(self.url)
+        """Fetches the HTML content from the given URL.
+
+        If the page was already fetched by a concurrent fetcher, only the
+        parsing step (if any) runs; otherwise the page is requested directly.
+        """
+        if isinstance(self._pre_fetched_html, element.Tag):
+            self._html_content = self._pre_fetched_html
+        elif self._pre_fetched_html is not None:
+            self._html_content = parse_page_body(self._pre_fetched_html)
+        else:
+            self._html_content = get_page_body(self.url)
 
     def _get_text(self):
         """Extracts the relevant text from the HTML content."""
         self.text = extract_ispt_article_text(self._html_content)
 
-    def _summarize(self, device: str = "cpu"):
+    def _summarize(self, device: str = None):
         """
         Summarizes the extracted text.
 
         Parameters
         ----------
         device : str, optional
-            Device to use for summarization. Defaults to "cpu".
+            Device to use for summarization. Defaults to None, which picks
+            the fastest available device (CUDA, then MPS, then CPU).
         """
         if self.verbose:
             print("Summarizing the text...")
         self.summary = summarize_google_pegasus(self.text, device=device)
 
-    def _extract_keywords(self, device: str = "cpu"):
+    def _extract_keywords(self, device: str = None):
         """
         Extracts keywords from the text.
 
         Parameters
         ----------
         device : str, optional
-            Device to use for keyword extraction. Defaults to "cpu".
+            Device to use for keyword extraction. Defaults to None, which
+            picks the fastest available device (CUDA, then MPS, then CPU).
         """
         self.keywords = extract_keywords_vlt5(self.text, device=device)
 
-    def _determine_relevance(self):
-        """Calculates the relevance score and categorizes the case study."""
+    def _determine_relevance(self, scores: tuple[int, int] = None):
+        """
+        Calculates the relevance score and categorizes the case study.
+
+        Parameters
+        ----------
+        scores : tuple[int, int], optional
+            Precomputed (text score, AI keywords score). If None, the
+            scorer is called on this case study's text and keywords.
+        """
 
         # Calculate relevance scores based on methods A and B (refer to the docs/ProjectOverview.md)
         # and take the maximum of the two scores
-        self.relevance_score = max(self.scorer(self.text, self.keywords))
+        if scores is None:
+            scores = self.scorer(self.text, self.keywords)
+        self.relevance_score = max(scores)
 
         # Ensure relevance score is between 0 and 100
         self.relevance_score = max(0, min(100, self.relevance_score))
@@ -166,25 +233,6 @@ class CaseStudy:
         print(f"Relevance to Decarbonization: {
               self.relevant_to_decarbonization}")
 
-    def to_csv_row(self):
-        """
-        Returns a comma-separated string representation of the CaseStudy,
-        including title, URL, relevance, keywords, and summary (if available).
-
-        Returns
-        -------
-        str
-            Comma-separated string with case study information.
-        """
-        # Replace commas in the summary with semicolons
-        keywords_str = "; ".join(self.keywords) if self.keywords else ""
-
-        # Replace commas in the summary with semicolons
-        summary_str = self.summary.replace(",", ";") if self.summary else ""
-
-        # Return the case study information as a CSV row
-        return f'"{self.title}","{self.url}",{self.relevance_score},"{keywords_str}","{summary_str}"'
-
     def __repr__(self):
         """Returns a string representation of the CaseStudy object."""
         message = f"CaseStudy(title={self.title}, url={self.url})"
@@ -9,6 +9,21 @@ from pathlib import Path
 import json
 from ..utils import *
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
 
 class DecarbonizationScorer:
     """
@@ -28,10 +43,6 @@ class DecarbonizationScorer:
         Path to the JSON file containing the target keywords and scores.
     target_keywords : dict
         Dictionary of target keywords and their associated scores loaded from the JSON file.
-    text_score : int
-        Score of the input text based on the presence of target keywords.
-    ai_keywords_score : int
-        Score of the AI-generated keywords based on their match with the target keywords.
 
     Raises
     ------
@@ -56,8 +67,23 @@ class DecarbonizationScorer:
             keywords_json} does not exist."
         self.target_keywords = self._load_keywords(keywords_json)
 
-        self.text_score = 0
-        self.ai_keywords_score = 0
+        # Flatten the nested {group: {synonyms, score}} structure once so the
+        # hot matching loops read one pre-built dict instead of doing two
+        # nested lookups per synonym per text. Synonyms listed under several
+        # groups (e.g. "clean energy" sits in both "low carbon" and
+        # "renewable energy") sum their group scores, matching the per-group
+        # scans this dict replaces
+        self._flat_keywords = {}
+        for group_data in self.target_keywords.values():
+            group_score = group_data.get("score", 0)
+            for synonym in group_data.get('synonyms', []):
+                synonym = synonym.lower()
+                self._flat_keywords[synonym] = (
+                    self._flat_keywords.get(synonym, 0) + group_score)
+
+        # Build an Aho-Corasick automaton over all synonyms once, so scoring
+        # a text is a single linear pass instead of a per-keyword scan
+        self._automaton = self._build_automaton() if ahocorasick else None
 
     def _load_keywords(self, keywords_json: str | Path) -> dict:
         """
@@ -73,10 +99,40 @@ class DecarbonizationScorer:
         dict
             Dictionary of keywords and scores.
         """
+        # orjson parses a few times faster than the stdlib; fall back to
+        # json when it is not installed
+        if orjson is not None:
+            with open(keywords_json, 'rb') as f:
+                return orjson.loads(f.read())
+
         with open(keywords_json, encoding='utf-8') as f:
             keywords = json.load(f)
         return keywords
 
+    def _build_automaton(self):
+        """
+        Builds an Aho-Corasick automaton over all target synonyms.
+
+        Each synonym is added in the same normalized form that
+        `preprocess_text` produces for the searched text (lowercase,
+        punctuation stripped), so hyphenated variants like "low-carbon"
+        match their normalized occurrences.
+
+        Returns
+        -------
+        ahocorasick.Automaton
+            Automaton mapping each normalized synonym back to its key in
+            `_flat_keywords`, enabling multi-pattern matching in one pass
+            over the text.
+        """
+        automaton = ahocorasick.Automaton()
+        for synonym in self._flat_keywords:
+            normalized = " ".join(preprocess_text(synonym))
+            if normalized:
+                automaton.add_word(normalized, (normalized, synonym))
+        automaton.make_automaton()
+        return automaton
+
     def _ai_keywords_score(self, ai_gen_keywords: list[str], weight: int = 2) -> int:
         """
         Calculates the score for the AI-generated keywords.
@@ -87,7 +143,13 @@ class DecarbonizationScorer:
             List of AI-generated keywords.
         weight : int, optional
             Weighting factor for the AI keywords score, by default 2.
+
+        Returns
+        -------
+        int
+            The score of the AI-generated keywords.
         """
+        score = 0
 
         # Check if the AI-generated keywords match the target keywords
         for keygroup in self.target_keywords:
@@ -96,7 +158,9 @@ class DecarbonizationScorer:
             group_score = self.target_keywords[keygroup].get("score", 0)
 
             if fuzzy_match_two_sets_keywords(chunk_keywords(ai_gen_keywords), group_keywords):
-                self.ai_keywords_score += group_score * weight
+                score += group_score * weight
+
+        return score
 
     def _text_score(self, text: str) -> int:
         """
@@ -106,20 +170,115 @@ class DecarbonizationScorer:
         ----------
         text : str
             The input text to be scored.
+
+        Returns
+        -------
+        int
+            The score of the input text.
         """
+        score = 0
+        residual = self._flat_keywords
 
-        # Check if the text contains the target keywords
-        # iterate over the target keywords of each group
-        for keygroup in self.target_keywords:
+        if self._automaton is not None:
+            # Exact prefilter: one linear pass over the normalized text,
+            # padded with spaces so word boundaries can be checked on both
+            # sides of each hit (otherwise "dehydrogenation" would score an
+            # exact "hydrogen" hit that the fuzzy matchers reject)
+            haystack = " " + " ".join(preprocess_text(text)) + " "
+            matched = set()
+            for end_index, (normalized, synonym) in self._automaton.iter(haystack):
+                start_index = end_index - len(normalized) + 1
+                if (haystack[start_index - 1] == " "
+                        and haystack[end_index + 1] == " "):
+                    matched.add(synonym)
 
-            group_keywords = self.target_keywords[keygroup].get('synonyms', [])
-            group_score = self.target_keywords[keygroup].get("score", 0)
+            # Each matched synonym scores once regardless of how many times
+            # it occurs, mirroring the early-return of fuzzy_match_keyword;
+            # only keywords with zero exact hits fall through to the fuzzy
+            # scorers below
+            for synonym in matched:
+                score += self._flat_keywords[synonym]
 
-            for keyword in group_keywords:
-                if number_of_hits := fuzzy_match_keyword(text, keyword):
-                    # the multiplier is the number of times the keyword appears in the text
-                    # multiplied by the score of the keyword group
-                    self.text_score += number_of_hits * group_score
+            residual = {keyword: group_score
+                        for keyword, group_score in self._flat_keywords.items()
+                        if keyword not in matched}
+            if not residual:
+                return score
+
+        if process is not None:
+            # Batched fuzzy matching of the residual keywords against the
+            # text in one C++ call
+            return score + self._text_score_rapidfuzz(text, keywords=residual)
+
+        # Last-resort fallback: fuzzy per-keyword scan over the residual
+        # {synonym: group score} dict. The text is tokenized once; every
+        # keyword matches against the same word list
+        text_words = preprocess_text(text)
+        for keyword, group_score in residual.items():
+            if number_of_hits := fuzzy_match_keyword(text_words, keyword):
+                # the multiplier is the number of times the keyword appears in
+                # the text multiplied by the score of the keyword group
+                score += number_of_hits * group_score
+
+        return score
+
+    def _text_score_rapidfuzz(self, text: str, threshold: int = 80,
+                              keywords: dict = None) -> int:
+        """
+        Scores the text by fuzzy-matching all keywords in one batched call.
+
+        The whole keywords-by-candidates similarity matrix is computed by
+        RapidFuzz in C++ (process.cdist) instead of a Python-level loop per
+        keyword, matching against the text's word n-grams.
+
+        Parameters
+        ----------
+        text : str
+            The input text to be scored.
+        threshold : int, optional
+            Similarity cutoff in the 0-100 RapidFuzz scale, by default 80.
+        keywords : dict, optional
+            {synonym: group score} subset to match, by default the whole
+            pre-flattened keyword dict. The exact-prefilter path passes only
+            the keywords that had no exact hit.
+
+        Returns
+        -------
+        int
+            The score of the input text.
+        """
+        if keywords is None:
+            keywords = self._flat_keywords
+
+        # Tokenize the text once and build the candidate word n-grams (up to
+        # the longest keyword phrase in the target set)
+        tokens = preprocess_text(text)
+        max_words = max(
+            (len(keyword.split()) for keyword in keywords),
+            default=1)
+
+        candidates = set()
+        for n in range(1, max_words + 1):
+            candidates.update(
+                " ".join(tokens[i: i + n])
+                for i in range(len(tokens) - n + 1))
+        candidates = list(candidates)
+
+        if not candidates:
+            return 0
+
+        keyword_list = list(keywords)
+        similarity = process.cdist(
+            keyword_list, candidates, scorer=fuzz.ratio, score_cutoff=threshold)
+
+        # A keyword scores once if any candidate n-gram clears the cutoff,
+        # mirroring the early-return of fuzzy_match_keyword
+        score = 0
+        for keyword, row in zip(keyword_list, similarity):
+            if row.max() >= threshold:
+                score += keywords[keyword]
+
+        return score
 
     def __call__(self, text: str, ai_gen_keywords: list[str] = None) -> tuple[int, int]:
         """
@@ -137,12 +296,14 @@ class DecarbonizationScorer:
         tuple[int, int]
             A tuple containing the text score and the AI keywords score.
         """
-        self._text_score(text)
-
-        if ai_gen_keywords:
-            self._ai_keywords_score(ai_gen_keywords)
+        # The scores are computed locally (no instance state is mutated),
+        # so a shared scorer is reentrant and safe to call from worker
+        # processes or threads
+        text_score = self._text_score(text)
+        ai_keywords_score = (
+            self._ai_keywords_score(ai_gen_keywords) if ai_gen_keywords else 0)
 
-        return self.text_score, self.ai_keywords_score
+        return text_score, ai_keywords_score
 
     def __repr__(self):
         return f"DecarbonizationScorer(target_keywords in {self.keywords_json})"
@@ -1,8 +1,184 @@
+from pathlib import Path
+import torch
 from transformers import pipeline
-from transformers import T5Tokenizer, T5ForConditionalGeneration
+from transformers import AutoTokenizer, T5ForConditionalGeneration
 
+# Whether to run the models through ONNX Runtime (requires the optional
+# `optimum[onnxruntime]` package). The one-time export pays for itself when
+# the same fixed models are applied to many texts.
+USE_ONNX = False
 
-def summarize_google_pegasus(text: str, min_length: int = 60, max_length: int = 100, device: str = "cpu"):
+# Where exported ONNX graphs are persisted between runs
+_ONNX_CACHE_DIR = Path.home() / ".cache" / "ispt_heat_scraper" / "onnx"
+
+# Pick the fastest available device once at import; GPU inference is an
+# order of magnitude faster than CPU for these model sizes
+_DEFAULT_DEVICE = (
+    "cuda" if torch.cuda.is_available()
+    else "mps" if torch.backends.mps.is_available()
+    else "cpu")
+
+# Character-level cap applied before tokenization. Both models truncate to
+# ~1024/512 tokens anyway, so tokenizing a very long scraped page past this
+# point is pure wasted work.
+_MAX_INPUT_CHARS = 8000
+
+# Lazily-initialized module-level singletons. Loading a transformer model
+# dominates the cost of a single forward pass, so the models, tokenizers,
+# and pipelines are loaded once per (model, device) and reused across calls.
+_PEGASUS_PIPELINES = {}
+_VLT5_MODELS = {}
+_VLT5_TOKENIZER = None
+
+
+def _quantize_for_device(model, device: str):
+    """Shrinks the model weights to cheaper dtypes for inference.
+
+    On CUDA the weights are cast to FP16; on CPU the linear layers get
+    dynamic int8 quantization. Both roughly halve the bytes moved through
+    memory on the forward pass, which dominates inference time.
+
+    Parameters
+    ----------
+    model : torch.nn.Module
+        The model to quantize.
+    device : str
+        The device the model runs on ('cpu', 'cuda', 'mps', etc.).
+
+    Returns
+    -------
+    torch.nn.Module
+        The quantized (or half-precision) model.
+    """
+    if device.startswith("cuda"):
+        return model.half()
+    if device == "cpu":
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
+
+
+def _load_onnx_seq2seq(model_name: str):
+    """Loads a seq2seq model through ONNX Runtime.
+
+    The graph is exported once and persisted under `_ONNX_CACHE_DIR`;
+    subsequent runs load the exported graph directly instead of
+    re-exporting from the PyTorch weights.
+
+    Parameters
+    ----------
+    model_name : str
+        The Hugging Face model name to load.
+
+    Returns
+    -------
+    optimum.onnxruntime.ORTModelForSeq2SeqLM
+        The ONNX Runtime model.
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+    export_dir = _ONNX_CACHE_DIR / model_name.replace("/", "--")
+
+    if export_dir.is_dir():
+        return ORTModelForSeq2SeqLM.from_pretrained(export_dir)
+
+    model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+    export_dir.mkdir(parents=True, exist_ok=True)
+    model.save_pretrained(export_dir)
+
+    return model
+
+
+def _compile_for_inference(model, device: str):
+    """Compiles the model's forward pass when torch.compile is available.
+
+    Compilation trades a one-time warm-up for lower eager-dispatch
+    overhead on every subsequent forward pass. The forward method is
+    compiled in place rather than wrapping the whole module: `generate`
+    on a wrapped OptimizedModule dispatches back to the original module's
+    uncompiled forward, so the wrap would never run for these models.
+    CPU models are skipped — they carry the dynamically int8-quantized
+    linear layers from `_quantize_for_device`, which torch.compile does
+    not trace reliably.
+
+    Parameters
+    ----------
+    model : torch.nn.Module
+        The model to compile.
+    device : str
+        The device the model runs on ('cpu', 'cuda', 'mps', etc.).
+
+    Returns
+    -------
+    torch.nn.Module
+        The model, with its forward compiled where supported.
+    """
+    if hasattr(torch, "compile") and device != "cpu":
+        model.forward = torch.compile(model.forward, mode="reduce-overhead")
+    return model
+
+
+def _get_pegasus_pipeline(model_name: str, device: str):
+    """Returns the cached summarization pipeline for the given device."""
+    if device not in _PEGASUS_PIPELINES:
+        if USE_ONNX:
+            summarizer = pipeline(
+                "summarization", model=_load_onnx_seq2seq(model_name),
+                tokenizer=model_name)
+        else:
+            summarizer = pipeline(
+                "summarization", model=model_name, tokenizer=model_name,
+                device=device)
+            summarizer.model = _compile_for_inference(
+                _quantize_for_device(summarizer.model, device), device)
+        _PEGASUS_PIPELINES[device] = summarizer
+    return _PEGASUS_PIPELINES[device]
+
+
+def _get_vlt5(model_name: str, device: str):
+    """Returns the cached VLT5 model and tokenizer for the given device."""
+    global _VLT5_TOKENIZER
+    if device not in _VLT5_MODELS:
+        if USE_ONNX:
+            _VLT5_MODELS[device] = _load_onnx_seq2seq(model_name)
+        else:
+            model = T5ForConditionalGeneration.from_pretrained(
+                model_name).to(device)
+            _VLT5_MODELS[device] = _compile_for_inference(
+                _quantize_for_device(model, device), device)
+    if _VLT5_TOKENIZER is None:
+        # The fast (Rust-backed) tokenizer tokenizes long scraped articles
+        # several times faster than the Python T5Tokenizer
+        _VLT5_TOKENIZER = AutoTokenizer.from_pretrained(
+            model_name, use_fast=True)
+    return _VLT5_MODELS[device], _VLT5_TOKENIZER
+
+
+def _length_sorted(texts: list[str], tokenizer) -> tuple[list[str], list[int]]:
+    """Sorts texts by tokenized length for batched inference.
+
+    Batches of similarly-sized inputs minimize the padding each short text
+    pays to match the longest text in its batch.
+
+    Parameters
+    ----------
+    texts : list of str
+        The texts to sort.
+    tokenizer
+        The tokenizer used to measure each text's length in tokens.
+
+    Returns
+    -------
+    tuple[list[str], list[int]]
+        The texts sorted by token length, and the original index of each
+        sorted text (used to restore the original order afterwards).
+    """
+    lengths = [len(tokenizer.encode(text)) for text in texts]
+    order = sorted(range(len(texts)), key=lengths.__getitem__)
+    return [texts[i] for i in order], order
+
+
+def summarize_google_pegasus(text: str, min_length: int = 60, max_length: int = 100, device: str = None):
     """Summarizes text using the Google Pegasus model.
 
     This function utilizes the `google/pegasus-cnn_dailymail` model from
@@ -18,7 +194,7 @@ def summarize_google_pegasus(text: str, min_length: int = 60, max_length: int =
         The maximum length of the summary in words. Default is 100.
     device : str, optional
         The device to run the model on ('cpu', 'cuda', 'mps', etc.).
-        Default is 'cpu'.
+        Defaults to the fastest available device (CUDA, then MPS, then CPU).
 
     Returns
     -------
@@ -39,22 +215,80 @@ def summarize_google_pegasus(text: str, min_length: int = 60, max_length: int =
     'This is an example article with a lot of text. It discusses various topics and goes into detail about each one. The summarizer can condense this information.'
     """
 
+    return summarize_google_pegasus_batch(
+        [text], min_length=min_length, max_length=max_length, device=device)[0]
+
+
+def summarize_google_pegasus_batch(texts: list[str], min_length: int = 60,
+                                   max_length: int = 100, device: str = None,
+                                   batch_size: int = 8) -> list[str]:
+    """Summarizes a batch of texts using the Google Pegasus model.
+
+    Loading the model once and running a single batched pipeline call
+    amortizes the model load over all texts and lets the forward passes
+    run on batched kernels instead of one text at a time.
+
+    Parameters
+    ----------
+    texts : list of str
+        The texts to be summarized.
+    min_length : int, optional
+        The minimum length of each summary in words. Default is 60.
+    max_length : int, optional
+        The maximum length of each summary in words. Default is 100.
+    device : str, optional
+        The device to run the model on ('cpu', 'cuda', 'mps', etc.).
+        Defaults to the fastest available device (CUDA, then MPS, then CPU).
+    batch_size : int, optional
+        The number of texts fed to the model per forward pass. Default is 8.
+
+    Returns
+    -------
+    list of str
+        The generated summaries, in the same order as the input texts.
+
+    Raises
+    ------
+    OSError
+        If the model is not found or cannot be loaded.
+    """
+
     MODEL_NAME = "google/pegasus-cnn_dailymail"
 
+    if not texts:
+        return []
+
+    if device is None:
+        device = _DEFAULT_DEVICE
+
     try:
-        summarizer = pipeline("summarization", model=MODEL_NAME,
-                              tokenizer=MODEL_NAME, device=device)
-        summary = summarizer(text, min_length=min_length,
-                             max_length=max_length)
+        summarizer = _get_pegasus_pipeline(MODEL_NAME, device)
+
+        # Feed the texts sorted by length so each batch pads as little
+        # as possible, then restore the original order afterwards
+        # Cap very long pages before tokenization; the model only sees the
+        # first ~1024 tokens either way
+        texts = [text[:_MAX_INPUT_CHARS] for text in texts]
+
+        sorted_texts, order = _length_sorted(texts, summarizer.tokenizer)
+
+        # inference_mode drops autograd bookkeeping from the forward passes
+        with torch.inference_mode():
+            sorted_summaries = summarizer(sorted_texts, min_length=min_length,
+                                          max_length=max_length,
+                                          batch_size=batch_size,
+                                          truncation=True)
     except Exception as e:
         raise OSError(f"Error using the model '{MODEL_NAME}': {e}") from e
 
-    summary = summary[0]['summary_text'].replace("<n>", "\n")
+    summaries = [None] * len(texts)
+    for original_index, summary in zip(order, sorted_summaries):
+        summaries[original_index] = summary['summary_text'].replace("<n>", "\n")
 
-    return summary
+    return summaries
 
 
-def extract_keywords_vlt5(text: str, device: str = "cpu"):
+def extract_keywords_vlt5(text: str, device: str = None):
     """Extracts keywords from text using the VLT5 model.
 
     This function utilizes the `Voicelab/vlt5-base-keywords` model from
@@ -68,7 +302,7 @@ def extract_keywords_vlt5(text: str, device: str = "cpu"):
 
     device : str, optional
         The device to run the model on ('cpu', 'cuda', 'mps', etc.).
-        Default is 'cpu'.
+        Defaults to the fastest available device (CUDA, then MPS, then CPU).
 
     Returns
     -------
@@ -86,34 +320,90 @@ def extract_keywords_vlt5(text: str, device: str = "cpu"):
     >>> extract_keywords_vlt5(text)
     'machine learning, natural language processing, artificial intelligence'
     """
+    return extract_keywords_vlt5_batch([text], device=device)[0]
+
+
+def extract_keywords_vlt5_batch(texts: list[str], device: str = None,
+                                batch_size: int = 8) -> list[list[str]]:
+    """Extracts keywords from a batch of texts using the VLT5 model.
+
+    The model and tokenizer are loaded once and all texts are tokenized
+    (with padding) and generated in a single batched call, instead of
+    paying the model load cost per text.
+
+    Parameters
+    ----------
+    texts : list of str
+        The texts from which to extract keywords.
+    device : str, optional
+        The device to run the model on ('cpu', 'cuda', 'mps', etc.).
+        Defaults to the fastest available device (CUDA, then MPS, then CPU).
+    batch_size : int, optional
+        The number of texts fed to the model per generate call. Default is 8.
+
+    Returns
+    -------
+    list of list of str
+        The extracted keywords for each text, in the same order as the
+        input texts.
+
+    Raises
+    ------
+    OSError
+        If the model is not found or cannot be loaded.
+    """
     MODEL_NAME = "Voicelab/vlt5-base-keywords"
     TASK_PREFIX = "Keywords: "
 
+    if not texts:
+        return []
+
+    if device is None:
+        device = _DEFAULT_DEVICE
+
     try:
-        model = T5ForConditionalGeneration.from_pretrained(
-            MODEL_NAME).to(device)
-        tokenizer = T5Tokenizer.from_pretrained(MODEL_NAME, legacy=False)
-
-        input_sequences = [TASK_PREFIX + text]
-        input_ids = tokenizer(
-            input_sequences, return_tensors="pt", truncation=False).input_ids.to(device)
-
-        output = model.generate(
-            input_ids,
-            no_repeat_ngram_size=3,
-            num_beams=4,
-            max_length=120,
-            min_length=60,
-        )
-        predicted_keywords = tokenizer.decode(
-            output[0], skip_special_tokens=True)
+        model, tokenizer = _get_vlt5(MODEL_NAME, device)
+
+        # Cap very long pages before tokenization; the model input is
+        # truncated to 512 tokens either way
+        texts = [text[:_MAX_INPUT_CHARS] for text in texts]
+
+        # Feed the texts sorted by length so each batch pads as little
+        # as possible, then restore the original order afterwards
+        sorted_texts, order = _length_sorted(texts, tokenizer)
+
+        predicted_keywords = [None] * len(texts)
+        for start in range(0, len(sorted_texts), batch_size):
+            batch = sorted_texts[start:start + batch_size]
+
+            input_sequences = [TASK_PREFIX + text for text in batch]
+            input_ids = tokenizer(
+                input_sequences, return_tensors="pt", padding=True,
+                truncation=True, max_length=512).input_ids.to(device)
+
+            # inference_mode drops autograd bookkeeping from generation
+            with torch.inference_mode():
+                output = model.generate(
+                    input_ids,
+                    no_repeat_ngram_size=3,
+                    num_beams=4,
+                    max_length=120,
+                    min_length=60,
+                )
+            for offset, sequence in enumerate(output):
+                original_index = order[start + offset]
+                predicted_keywords[original_index] = tokenizer.decode(
+                    sequence, skip_special_tokens=True)
 
     except Exception as e:
         raise OSError(f"Error using the model '{MODEL_NAME}': {e}") from e
 
-    keywords_list = predicted_keywords.split(",")
+    keywords_lists = []
+    for predicted in predicted_keywords:
+        keywords_list = predicted.split(",")
 
-    # remove leading/trailing whitespace and empty strings
-    keywords_list = [keyword.strip() for keyword in keywords_list if keyword]
+        # remove leading/trailing whitespace and empty strings
+        keywords_lists.append(
+            [keyword.strip() for keyword in keywords_list if keyword])
 
-    return keywords_list
+    return keywords_lists
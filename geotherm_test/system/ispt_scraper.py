@@ -2,12 +2,43 @@
 The IsptHeatScraper class is a systematized way to scrape, analyze, and save case
  studies from the ISPT Heat project website.
 '''
+import csv
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
 import validators
 from ..scraping.scraper import BeautifulScraper
+from ..scraping.async_fetch import fetch_pages
 from ..analysis.case_study import CaseStudy
 from ..analysis.scorer import DecarbonizationScorer
+from ..summarization.summarizer import (
+    summarize_google_pegasus_batch, extract_keywords_vlt5_batch)
+from ..utils import get_page_bodies
+
+
+def _score_case(scorer: DecarbonizationScorer, text: str,
+                keywords: list[str]) -> tuple[int, int]:
+    """
+    Scores one case study's text and keywords.
+
+    Module-level so it can be pickled and dispatched to worker processes.
+
+    Parameters
+    ----------
+    scorer : DecarbonizationScorer
+        The (stateless) scorer shared across case studies.
+    text : str
+        The case study text to score.
+    keywords : list[str] or None
+        AI-generated keywords for the case study, if any.
+
+    Returns
+    -------
+    tuple[int, int]
+        The text score and the AI keywords score.
+    """
+    return scorer(text, keywords)
 
 
 class IsptHeatScraper:
@@ -66,6 +97,7 @@ class IsptHeatScraper:
 
         self.case_studies = []  # List of CaseStudy objects
         self.output_file = None  # Path to the output file
+        self._fh = None  # Open handle to the output file during a run
 
         print(f"Created a scraper for the ISPT Heat project case studies at {
               self.case_studies_url}.\n")
@@ -76,8 +108,12 @@ class IsptHeatScraper:
         print("Starting the scraping process.\n")
 
         self._create_output_files()
-        self._proccess_case_studies(generate_ai_keywords)
-        self._save_results()
+        try:
+            self._proccess_case_studies(generate_ai_keywords)
+            self._save_results()
+        finally:
+            self._fh.close()
+            self._fh = None
 
         print(f"Results saved in {self.output_file}")
 
@@ -87,23 +123,85 @@ class IsptHeatScraper:
 
         print("Processing the case studies.\n")
 
+        # Share one scorer across all case studies so the keywords JSON is
+        # loaded (and the matching automaton built) only once
+        shared_scorer = DecarbonizationScorer(self.keyword_json)
+
+        # Title pre-screen: when no AI keywords are requested, pages whose
+        # titles score zero are ruled out before any network fetch
+        fetch_urls = [
+            case_link
+            for case_title, case_link in self.scraper.articles.items()
+            if generate_ai_keywords or shared_scorer(case_title)[0] > 0
+        ]
+
+        # Fetch the remaining case-study pages concurrently up front
+        pre_fetched = dict(zip(fetch_urls, fetch_pages(fetch_urls)))
+
+        # Pages the async fetcher could not get (or all of them, when
+        # aiohttp is unavailable) are fetched on a thread pool instead of
+        # one at a time inside the per-case loop
+        failed_urls = [url for url in fetch_urls if pre_fetched[url] is None]
+        if failed_urls:
+            pre_fetched.update(
+                zip(failed_urls, get_page_bodies(failed_urls)))
+
+        # First pass: build the case studies (parse and text extraction only);
+        # model inference is deferred so it can run in batches below
         for case_title, case_link in self.scraper.articles.items():
             case_ = CaseStudy(
                 title=case_title,
                 url=case_link,
-                scorer=DecarbonizationScorer,
-                target_keywords_json=self.keyword_json,
+                scorer=shared_scorer,
                 generate_keywords=generate_ai_keywords,
+                defer_inference=True,
+                pre_fetched_html=pre_fetched.get(case_link),
             )
             self.case_studies.append(case_)
 
+        # Extract keywords for all case studies in one batched model call
+        if generate_ai_keywords:
+            keyword_lists = extract_keywords_vlt5_batch(
+                [case_.text for case_ in self.case_studies])
+        else:
+            keyword_lists = [None] * len(self.case_studies)
+
+        # Second pass: score all case studies across the CPU cores; the
+        # scorer is stateless, so scoring is embarrassingly parallel
+        with ProcessPoolExecutor() as executor:
+            all_scores = list(executor.map(
+                _score_case,
+                repeat(shared_scorer),
+                [case_.text for case_ in self.case_studies],
+                keyword_lists,
+            ))
+
+        for case_, keywords, scores in zip(
+                self.case_studies, keyword_lists, all_scores):
+            case_.complete_analysis(keywords=keywords, scores=scores)
+
+        # Summarize the relevant case studies in one batched model call
+        relevant_cases = [case_ for case_ in self.case_studies
+                          if case_.relevance_score >= 50]
+        summaries = summarize_google_pegasus_batch(
+            [case_.text for case_ in relevant_cases], batch_size=8)
+        for case_, summary in zip(relevant_cases, summaries):
+            case_.summary = summary
+
     def _save_results(self):
         """Saves the results to a CSV file."""
-        with open(self.output_file, 'a', encoding="utf-8") as f:
-            for case in self.case_studies:
-                if case.summary is not None:
-                    f.write(case.to_csv_row())
-                    f.write("\n")
+        # csv.writer handles quoting/escaping in C; the handle opened in
+        # _create_output_files is reused instead of reopening the file
+        writer = csv.writer(self._fh)
+        for case in self.case_studies:
+            if case.summary is not None:
+                writer.writerow([
+                    case.title,
+                    case.url,
+                    case.relevance_score,
+                    "; ".join(case.keywords) if case.keywords else "",
+                    case.summary,
+                ])
 
     def _find_case_studies(self):
         """Tasks the scraper to extract case study links and titles."""
@@ -122,9 +220,13 @@ class IsptHeatScraper:
             self.output_file = Path(self.output_dir) / \
                 f"results_{dt_string}.csv"
 
-        # Write the header
-        with open(self.output_file, 'w', encoding="utf-8") as f:
-            f.write("Title,URL,Relevance Score (out of 100),Keywords,Summary\n")
+        # Open the file once for the whole run (closed in `run`) with a
+        # generous buffer, and write the header
+        self._fh = self.output_file.open(
+            "w", encoding="utf-8", newline="", buffering=1 << 16)
+        csv.writer(self._fh).writerow(
+            ["Title", "URL", "Relevance Score (out of 100)", "Keywords",
+             "Summary"])
 
     def _assertions(self):
         """Performs assertions to validate input parameters."""
@@ -2,36 +2,241 @@
 This module contains utility functions for web scraping and text processing.
 '''
 import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from difflib import SequenceMatcher
-from copy import deepcopy
+from functools import lru_cache
+from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from bs4 import element, Comment
+import soupsieve as sv
 import validators
 
+# requests-cache persists responses in a local SQLite store, so repeat runs
+# against unchanged pages skip the network entirely; fall back to a plain
+# session when it is not installed
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Parse with lxml, a C extension typically 3-10x faster than the pure-Python
+# html.parser on real pages (lxml is an install requirement)
+_BS4_PARSER = "lxml"
+
+# CSS selectors used on every scraped page, compiled once at import with
+# soupsieve; Tag.select/select_one would otherwise go through soupsieve's
+# parse-and-LRU-lookup on each call.
+# _DECOMPOSABLE_SELECTOR: tags stripped from every page, pre-joined into
+# one grouped query; the rest drive the ISPT article text extraction
+_DECOMPOSABLE_SELECTOR = sv.compile("script,style,noscript,nav,form,footer")
+_ARTICLE_SEL = sv.compile("article")
+_TITLE_SEL = sv.compile("h1.entry-title")
+_INTRO_SEL = sv.compile("p.is-style-intro")
+_CONTENT_SEL = sv.compile("h2.wp-block-heading, p:not(.is-style-intro), ul")
+
+# One shared HTTP session: repeat requests reuse keep-alive connections and
+# pooled TLS sessions instead of paying a TCP + TLS handshake per page
+if requests_cache is not None:
+    # Keep the SQLite store in the user cache dir (next to the ONNX
+    # exports) rather than dropping it into whatever directory the
+    # scraper happens to be run from
+    _HTTP_CACHE_DIR = Path.home() / ".cache" / "ispt_heat_scraper"
+    _HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _SESSION = requests_cache.CachedSession(
+        cache_name=str(_HTTP_CACHE_DIR / "http_cache"), backend="sqlite",
+        expire_after=timedelta(hours=24))
+else:
+    _SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "ispt_heat_scraper/0.0.1"})
+
+# Retry transient failures (with exponential backoff) inside urllib3, so a
+# single 503 halfway through a long scrape does not force a full rerun
+_RETRIES = Retry(total=3, backoff_factor=0.5,
+                 status_forcelist=(429, 500, 502, 503, 504))
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16, pool_maxsize=16, max_retries=_RETRIES))
+
+# Compiled once at import; the fuzzy matchers strip punctuation from every
+# text and keyword, and going through re.sub would redo the pattern-cache
+# lookup on each call
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# RapidFuzz computes the same InDel similarity as SequenceMatcher.ratio with
+# a bit-parallel C++ kernel (typically 20-50x faster on short strings); fall
+# back to difflib when it is not installed
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+    from rapidfuzz import process as _rf_process
+except ImportError:
+    _rf_fuzz = _rf_process = None
+
+# Numba-compiled InDel kernel on uint8 arrays: a middle tier between
+# RapidFuzz (preferred) and difflib (last resort) when only numba/numpy
+# happen to be installed
+try:
+    import numpy as _np
+    from .utils_kernels import indel_ratio_u8 as _indel_ratio_u8
+except ImportError:
+    _np = _indel_ratio_u8 = None
+
+
+def preprocess_text(text: str) -> list[str]:
+    """
+    Normalizes text into a list of lowercase words for fuzzy matching.
+
+    Calling this once per article and passing the word list straight into
+    `fuzzy_match_keyword` avoids re-running the punctuation stripping,
+    lowercasing, and split over the same text for every keyword queried.
+
+    Parameters
+    ----------
+    text : str
+        The text to normalize.
+
+    Returns
+    -------
+    list of str
+        The lowercase words of the text, stripped of punctuation.
+    """
+    return _PUNCT_RE.sub('', text).lower().split()
+
+
+def _native_threshold(threshold: float) -> float:
+    """
+    Returns the similarity threshold in the active scorer's native scale.
+
+    RapidFuzz scores in 0..100, so the threshold is scaled up once instead
+    of dividing every computed ratio back down to 0..1.
+
+    Parameters
+    ----------
+    threshold : float
+        The similarity threshold between 0 and 1.
+
+    Returns
+    -------
+    float
+        The threshold in the scale of the ratios produced by
+        `_keyword_matcher`.
+    """
+    return threshold * 100 if _rf_fuzz is not None else threshold
+
+
+def _keyword_matcher(keyword: str, threshold: float, prune: bool = True):
+    """
+    Returns a ratio(word) function bound to the given keyword.
+
+    With RapidFuzz this is a thin wrapper over the C++ kernel. Without it
+    but with numba installed, a JIT-compiled InDel kernel runs on
+    pre-encoded uint8 arrays (see `utils_kernels`). With the
+    difflib fallback, a single SequenceMatcher keeps the keyword as its
+    second sequence so its b2j index is built once (instead of per word),
+    and the cheap quick_ratio upper bound prunes most candidates before
+    the expensive matching-block search.
+
+    Parameters
+    ----------
+    keyword : str
+        The keyword to compare words against.
+    threshold : float
+        The similarity threshold between 0 and 1 (used for pruning).
+    prune : bool, optional
+        Whether sub-threshold ratios may be short-circuited to 0.0. Only
+        sound for callers that compare each ratio against the threshold
+        directly; callers that average several ratios (the phrase branch
+        of `fuzzy_match_keyword`) need the exact values, since a zeroed
+        ratio silently drags the average down. Default is True.
+
+    Returns
+    -------
+    callable
+        A function mapping a word to its similarity ratio with the keyword,
+        in the scale matching `_native_threshold`.
+    """
+    if _rf_fuzz is not None:
+        if prune:
+            # score_cutoff lets RapidFuzz apply its internal length bound
+            # and abort hopeless comparisons inside the C++ kernel
+            cutoff = threshold * 100
+            return lambda word: _rf_fuzz.ratio(
+                keyword, word, score_cutoff=cutoff)
+        return lambda word: _rf_fuzz.ratio(keyword, word)
+
+    if _indel_ratio_u8 is not None:
+        # Numba kernel fallback: strings cannot be JIT-compiled, so the
+        # keyword is encoded once to a uint8 code array and each word is
+        # encoded on the fly before hitting the native DP loop
+        keyword_u8 = _np.frombuffer(
+            keyword.encode("ascii", "ignore"), _np.uint8)
+        keyword_length = keyword_u8.shape[0]
+
+        def _ratio_jit(word: str) -> float:
+            word_u8 = _np.frombuffer(
+                word.encode("ascii", "ignore"), _np.uint8)
+            # Same length bound as the difflib path: reject pairs whose
+            # lengths are too different before running the DP
+            word_length = word_u8.shape[0]
+            if prune and (2 * min(keyword_length, word_length)
+                          < threshold * (keyword_length + word_length)):
+                return 0.0
+            return _indel_ratio_u8(word_u8, keyword_u8)
+
+        return _ratio_jit
+
+    matcher = SequenceMatcher(autojunk=False)
+    matcher.set_seq2(keyword)
+    keyword_length = len(keyword)
+
+    def _ratio(word: str) -> float:
+        if prune:
+            # Length bound: the ratio can never exceed
+            # 2*min(|a|,|b|)/(|a|+|b|), so pairs with very different
+            # lengths are rejected with no matching work at all
+            word_length = len(word)
+            if (2 * min(keyword_length, word_length)
+                    < threshold * (keyword_length + word_length)):
+                return 0.0
+
+            matcher.set_seq1(word)
+            # Character-histogram upper bound: if even quick_ratio cannot
+            # reach the threshold, skip the full Ratcliff/Obershelp
+            # matching
+            if matcher.quick_ratio() < threshold:
+                return 0.0
+            return matcher.ratio()
+
+        matcher.set_seq1(word)
+        return matcher.ratio()
+
+    return _ratio
+
 
 def remove_unwanted_elements(html_content: element.Tag) -> element.Tag:
     """
     Removes unwanted elements and comments from a BeautifulSoup object.
 
+    Note that the object is cleaned in place (and also returned): copying
+    a parsed tree walks and duplicates every node, which is one of the
+    slowest operations in BeautifulSoup, and no caller uses the original
+    tree afterwards.
+
     Parameters
     ----------
     html_content : element.Tag
-          The BeautifulSoup object to clean.
+          The BeautifulSoup object to clean. Mutated in place.
 
     Returns
     -------
     bs4.BeautifulSoup
         The cleaned BeautifulSoup object.
     """
-    html_content = deepcopy(html_content)
-    decomposable_elements = [
-        "script", "style", "noscript", "nav", "form", "footer",
-    ]
-
-    for tag in decomposable_elements:
-        for element_ in html_content.find_all(tag):
-            element_.decompose()
+    # One grouped CSS query walks the tree once instead of once per tag name
+    for element_ in _DECOMPOSABLE_SELECTOR.select(html_content):
+        element_.decompose()
 
     # Remove comments
     for element_ in html_content(text=lambda text: isinstance(text, Comment)):
@@ -40,10 +245,41 @@ def remove_unwanted_elements(html_content: element.Tag) -> element.Tag:
     return html_content
 
 
+def parse_page_body(html: str | bytes) -> element.Tag:
+    """
+    Parses raw HTML and returns the cleaned body element.
+
+    Parameters
+    ----------
+    html : str or bytes
+        The raw HTML content of the page.
+
+    Returns
+    -------
+    element.Tag
+        The cleaned body element of the page.
+    """
+
+    # Parse the page
+    parsed_page = BeautifulSoup(html, _BS4_PARSER)
+
+    # Find the body tag and clean it
+    body_tag = parsed_page.find("body")
+    cleaned_body = remove_unwanted_elements(body_tag)
+
+    # Return the body element
+    return cleaned_body
+
+
+@lru_cache(maxsize=256)
 def get_page_body(url: str) -> element.Tag:
     """
     Requests a page and returns the parsed body element.
 
+    The parsed tree is memoized per URL, so asking for the same page twice
+    within a run costs a dict lookup instead of a (possibly cached) request
+    plus a full re-parse. Callers treat the returned tree as read-only.
+
     Parameters
     ----------
     url : str
@@ -55,21 +291,55 @@ def get_page_body(url: str) -> element.Tag:
         The body element of the page.
     """
 
-    # Request the page
-    response = requests.get(url, timeout=10)
+    # Request the page through the shared keep-alive session; stream=True
+    # defers the body download until the parser asks for it
+    response = _SESSION.get(url, timeout=10, stream=True)
 
     # raise an exception if the request failed
     response.raise_for_status()
 
-    # Parse the page
-    parsed_page = BeautifulSoup(response.content, "html.parser")
+    # Let urllib3 decode gzip/deflate transparently and hand the raw
+    # file-like body to BeautifulSoup. Note this is not incremental:
+    # BeautifulSoup read()s file objects whole before parsing. The gain is
+    # skipping the response.content path, which assembles the body from
+    # chunks and keeps its own copy alive on the Response object
+    response.raw.decode_content = True
+    parsed_page = BeautifulSoup(response.raw, _BS4_PARSER)
 
-    # Find the body tag and clean it
-    body_tag = parsed_page.find("body")
-    cleaned_body = remove_unwanted_elements(body_tag)
+    # Find the body tag, clean it, and return it
+    return remove_unwanted_elements(parsed_page.find("body"))
 
-    # Return the body element
-    return cleaned_body
+
+def get_page_bodies(urls: list[str], max_workers: int = 8) -> list[element.Tag]:
+    """
+    Fetches and parses several pages concurrently.
+
+    The fetches are I/O-bound (waiting on the server), so running them on a
+    thread pool overlaps the request latencies. All threads share the
+    module-level session, which is thread-safe for GET requests.
+
+    Parameters
+    ----------
+    urls : list of str
+        The URLs of the pages to request.
+    max_workers : int, optional
+        The number of worker threads. Defaults to 8.
+
+    Returns
+    -------
+    list of element.Tag or None
+        The cleaned body element of each page, in the same order as the
+        input URLs, with None for pages that could not be fetched.
+    """
+
+    def _fetch(url: str):
+        try:
+            return get_page_body(url)
+        except requests.RequestException:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_fetch, urls))
 
 
 def log_and_print(message: str, logger=None, verbose: bool = False):
@@ -193,43 +463,51 @@ def extract_ispt_article_text(parsed_html_content):
     """
 
     # limit to article content
-    parsed_html_content = parsed_html_content.select_one("article")
+    parsed_html_content = _ARTICLE_SEL.select_one(parsed_html_content)
 
     # Title (assuming it's within the main content)
-    title = parsed_html_content.select_one("h1.entry-title").text.strip()
+    title = _TITLE_SEL.select_one(parsed_html_content).text.strip()
 
     # Introduction
-    intro_paragraph = parsed_html_content.select_one("p.is-style-intro")
+    intro_paragraph = _INTRO_SEL.select_one(parsed_html_content)
     introduction = intro_paragraph.text.strip() if intro_paragraph else ""
 
-    # Initialize output string with title and introduction
-    output_string = f"{title}\n\n{introduction}\n\n"
+    # Collect the output pieces in a list and join once at the end; repeated
+    # string += re-copies the whole accumulator on every append (O(n^2) for
+    # long articles)
+    parts = [title, "\n\n", introduction, "\n\n"]
 
     # Headings and content
     current_heading = None
 
     # Extract headings and paragraphs, excluding the introduction
-    for element_ in parsed_html_content.select("h2.wp-block-heading, p:not(.is-style-intro), ul"):
+    for element_ in _CONTENT_SEL.select(parsed_html_content):
         if element_.name == "h2":
             current_heading = element_.text.strip()
-            output_string += f"{current_heading}\n"
+            parts.append(current_heading)
+            parts.append("\n")
         elif element_.name == "ul":
             # Handle lists by extracting list items with newlines
             for item in element_.find_all("li"):
-                output_string += f"- {item.get_text(strip=True)}\n"
+                parts.append("- ")
+                parts.append(item.get_text(strip=True))
+                parts.append("\n")
         elif current_heading:
-            output_string += f"{element_.text.strip()}\n"
+            parts.append(element_.text.strip())
+            parts.append("\n")
 
-    return output_string
+    return "".join(parts)
 
 
-def fuzzy_match_keyword(text: str, keyword: str, threshold: float = 0.8, verbose: bool = False) -> int:
+def fuzzy_match_keyword(text: str | list[str], keyword: str, threshold: float = 0.8, verbose: bool = False) -> int:
     """Fuzzy matches a keyword or a phrase (multiple keywords) within a text.
 
     Parameters
     ----------
-    text : str
-        The text to search within.
+    text : str or list of str
+        The text to search within, either raw or already tokenised with
+        `preprocess_text` (callers matching many keywords against the same
+        text should tokenise once and pass the word list).
     keyword : str
         The keyword or phrase to search for.
     threshold : float, optional
@@ -250,12 +528,12 @@ def fuzzy_match_keyword(text: str, keyword: str, threshold: float = 0.8, verbose
     1
     """
 
-    # Preprocess text and keyword: lowercase and remove special characters
-    text = re.sub(r'[^\w\s]', '', text).lower()
-    keyword = re.sub(r'[^\w\s]', '', keyword).lower()
+    # Preprocess the text (lowercase, remove special characters, split into
+    # words) unless the caller already passed a tokenised word list
+    text_words = preprocess_text(text) if isinstance(text, str) else text
 
-    # split the keyword/text into words
-    text_words = text.split()
+    # Preprocess and split the keyword
+    keyword = _PUNCT_RE.sub('', keyword).lower()
     keyword_words = keyword.split()
 
     # determine the number of keywords
@@ -264,11 +542,15 @@ def fuzzy_match_keyword(text: str, keyword: str, threshold: float = 0.8, verbose
     # Initialize the number of hits
     number_of_hits = 0
 
+    # Similarity threshold in the active scorer's native scale
+    cutoff = _native_threshold(threshold)
+
     if num_keywords == 1:  # Single keyword matching
+        ratio_of = _keyword_matcher(keyword, threshold)
         for word in text_words:
             # Calculate similarity ratio
-            ratio = SequenceMatcher(None, keyword, word).ratio()
-            if ratio >= threshold:  # Check if ratio exceeds threshold
+            ratio = ratio_of(word)
+            if ratio >= cutoff:  # Check if ratio exceeds threshold
                 number_of_hits += 1
 
             if number_of_hits > 0:
@@ -280,20 +562,27 @@ def fuzzy_match_keyword(text: str, keyword: str, threshold: float = 0.8, verbose
         if verbose:
             print(f"No match found for keyword: '{keyword}'")
 
-        return False  # No match found
+        return 0  # No match found
 
     else:  # Multiple keyword matching
+        # One matcher per keyword word, reused across all text chunks.
+        # Unpruned: the chunk test averages the per-word ratios, so a
+        # sub-threshold ratio short-circuited to 0.0 would tighten the
+        # phrase matching (one weak word could sink an otherwise-passing
+        # average)
+        matchers = [_keyword_matcher(keyword_word, threshold, prune=False)
+                    for keyword_word in keyword_words]
+
         # Iterate through possible keyword chunks
         for i in range(len(text_words) - num_keywords + 1):
             text_chunk = text_words[i: i + num_keywords]
             avg_ratio = 0
             for j in range(num_keywords):
                 # Calculate ratio for each keyword
-                ratio = SequenceMatcher(
-                    None, keyword_words[j], text_chunk[j]).ratio()
+                ratio = matchers[j](text_chunk[j])
                 avg_ratio += ratio
             avg_ratio /= num_keywords  # Calculate average similarity ratio
-            if avg_ratio >= threshold:  # Check if average ratio exceeds threshold
+            if avg_ratio >= cutoff:  # Check if average ratio exceeds threshold
                 number_of_hits += 1
 
             if number_of_hits > 0:
@@ -311,56 +600,6 @@ def fuzzy_match_keyword(text: str, keyword: str, threshold: float = 0.8, verbose
 # get two sets of keywords and fuzzy match them
 
 
-def fuzzy_match_two_sets_keywords(keywords_set_1: set, keywords_set_2: set, threshold: float = 0.85, verbose: bool = False) -> int:
-    """Fuzzy matches two sets of keywords.
-
-    Parameters
-    ----------
-    keywords_set_1 : set
-        The first set of keywords to match.
-    keywords_set_2 : set
-        The second set of keywords to match.
-    threshold : float, optional
-        The similarity threshold (between 0 and 1). Default is 0.8.
-    verbose : bool, optional
-        Whether to print matching information. Default is False.
-
-    Returns
-    -------
-    int
-        The number of times the keywords from set 1 were found in set 2.
-
-    Examples
-    --------
-    >>> fuzzy_match_two_sets_keywords({"machine learning", "natural language processing"}, {"machine learning", "deep learning"})
-    1
-    """
-
-    # Initialize the number of hits
-    number_of_hits = 0
-
-    # Iterate through keywords in the first set
-    for keyword_1 in keywords_set_1:
-        # Iterate through keywords in the second set
-        for keyword_2 in keywords_set_2:
-            # Calculate similarity ratio
-            ratio = SequenceMatcher(None, keyword_1, keyword_2).ratio()
-            if ratio >= threshold:  # Check if ratio exceeds threshold
-                number_of_hits += 1
-
-            if number_of_hits > 0:
-                if verbose:
-                    print("Matched keywords:", keyword_1, keyword_2)
-                    print("Similarity:", ratio)
-
-                return number_of_hits
-
-    if verbose:
-        print("No match found for the two sets of keywords.")
-
-    return number_of_hits
-
-
 def fuzzy_match_two_sets_keywords(keywords_set_1: set, keywords_set_2: set, threshold: float = 0.85, verbose: bool = False) -> bool:
     """Fuzzy matches two sets of keywords.
 
@@ -390,10 +629,42 @@ def fuzzy_match_two_sets_keywords(keywords_set_1: set, keywords_set_2: set, thre
     keywords_set_1 = {keyword.lower() for keyword in keywords_set_1}
     keywords_set_2 = {keyword.lower() for keyword in keywords_set_2}
 
+    if not keywords_set_1 or not keywords_set_2:
+        return False
+
+    if _rf_process is not None:
+        # Scan the second set in C++ per query keyword and stop at the
+        # first query with a hit, instead of materializing the full
+        # n x m similarity matrix
+        cutoff = threshold * 100
+        choices = list(keywords_set_2)
+        for keyword_1 in keywords_set_1:
+            match = _rf_process.extractOne(
+                keyword_1, choices, scorer=_rf_fuzz.ratio,
+                score_cutoff=cutoff)
+            if match is not None:
+                if verbose:
+                    print("Matched keywords:", keyword_1, match[0])
+                    print("Similarity:", match[1])
+                return True
+
+        if verbose:
+            print("No match found for the two sets of keywords.")
+        return False
+
+    # Fallback (rapidfuzz unavailable): pairwise Python loop
     # Iterate through keywords in the first set
     for keyword_1 in keywords_set_1:
+        length_1 = len(keyword_1)
         # Iterate through keywords in the second set
         for keyword_2 in keywords_set_2:
+            # Length bound: skip pairs whose lengths differ too much for the
+            # ratio to possibly reach the threshold
+            length_2 = len(keyword_2)
+            if (2 * min(length_1, length_2)
+                    < threshold * (length_1 + length_2)):
+                continue
+
             # Calculate similarity ratio
             ratio = SequenceMatcher(None, keyword_1, keyword_2).ratio()
             if ratio >= threshold:  # Check if ratio exceeds threshold
@@ -445,15 +716,19 @@ def chunk_keywords(keywords):
 
     # Initialize the set of chunked keywords
     chunked_keywords = set()
+    add = chunked_keywords.add  # Bind the method once, outside the hot loop
 
     # Iterate through each keyword
     for keyword in keywords:
         # Split the keyword into words
         words = keyword.split()
-        for i, word in enumerate(words):
-            chunked_keywords.add(word)  # Add single word
 
-            # Add word pair if not the last word
-            if i < len(words) - 1:
-                chunked_keywords.add(f"{word} {words[i + 1]}")  # Add word pair
+        # Bulk-insert the single words in one C-level call
+        chunked_keywords.update(words)
+
+        # Add the word pairs; plain concatenation skips the f-string
+        # formatting machinery
+        for word, next_word in zip(words, words[1:]):
+            add(word + " " + next_word)
+
     return chunked_keywords
@@ -0,0 +1,54 @@
+'''
+Numba-compiled numerical kernels backing the fuzzy matchers in `utils`.
+
+Numba cannot JIT Python string operations, so the matchers pre-encode each
+word to a numpy uint8 array of ASCII codes and the kernels work on those
+arrays; LLVM then lowers the dynamic-programming loops into tight native
+code. Importing this module requires numba and numpy — `utils` treats it
+as optional and falls back to difflib when the import fails.
+'''
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def indel_ratio_u8(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Computes the normalized InDel similarity of two uint8 code sequences.
+
+    This is the `2 * LCS / (|a| + |b|)` ratio that RapidFuzz's fuzz.ratio
+    computes, evaluated with a two-row longest-common-subsequence DP so
+    memory stays O(|b|) regardless of the input lengths.
+
+    Parameters
+    ----------
+    a, b : numpy.ndarray of numpy.uint8
+        The two sequences to compare, as ASCII character codes
+        (`np.frombuffer(s.encode('ascii', 'ignore'), np.uint8)`).
+
+    Returns
+    -------
+    float
+        The similarity ratio between 0.0 and 1.0.
+    """
+    length_a = a.shape[0]
+    length_b = b.shape[0]
+
+    if length_a == 0 and length_b == 0:
+        return 1.0
+
+    # Two-row LCS dynamic program: `prev` holds row i, `curr` row i + 1
+    prev = np.zeros(length_b + 1, dtype=np.int64)
+    curr = np.zeros(length_b + 1, dtype=np.int64)
+
+    for i in range(length_a):
+        char_a = a[i]
+        for j in range(length_b):
+            if char_a == b[j]:
+                curr[j + 1] = prev[j] + 1
+            else:
+                curr[j + 1] = max(prev[j + 1], curr[j])
+        prev, curr = curr, prev
+
+    lcs_length = prev[length_b]
+    return 2.0 * lcs_length / (length_a + length_b)
@@ -30,14 +30,19 @@ VERBOSE = True
 
 # Main -------------------------------------------------------------------------
 
-# create an instance of the system
-ispt_heat_scraper = IsptHeatScraper(
-    case_studies_url=WEBURL,
-    cases_html_address=projects_html_address,
-    keyword_json=KEYWRODS_JSON_FILE,
-    output_dir=OUTPUT_DIR,
-    verbose=VERBOSE
-)
-
-# run the system
-ispt_heat_scraper.run(GENERATE_KEYWORDS)
+# the guard is required now that the scraper scores on a process pool:
+# worker processes re-import __main__ on spawn platforms, and without it
+# each worker would re-run the whole scrape
+if __name__ == "__main__":
+
+    # create an instance of the system
+    ispt_heat_scraper = IsptHeatScraper(
+        case_studies_url=WEBURL,
+        cases_html_address=projects_html_address,
+        keyword_json=KEYWRODS_JSON_FILE,
+        output_dir=OUTPUT_DIR,
+        verbose=VERBOSE
+    )
+
+    # run the system
+    ispt_heat_scraper.run(GENERATE_KEYWORDS)
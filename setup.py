@@ -12,6 +12,11 @@ setup(
         'validators',
         'beautifulsoup4',
         'requests',
+        'requests-cache',
+        'aiohttp',
+        'pyahocorasick',
+        'lxml',
+        'rapidfuzz',
         'ipywidgets==8.1.5',
         'jupyterlab-widgets==3.0.13',
         'widgetsnbextension==4.0.13',